@@ -1,33 +1,291 @@
 """An implementation of PyTorch's DataLoader to showcase seqtools."""
 
 import copyreg
-import numbers
+import mmap
+import multiprocessing
+import operator
+import os
+import queue
+import time
+import weakref
 from functools import partial
+from multiprocessing import shared_memory
 
+import numpy as np
 import torch
 
 import seqtools
 
 
+# tensors backed by a pool slot, keyed by buffer address so that
+# pickle_tensor recognizes them (worker-side)
+pool_slots = {}
+
+# mappings of the workers' slot segments, mapped once on first receipt
+# and reused for every later batch (parent-side)
+attached_segments = {}
+
+# descriptors of the batches currently held by the parent, keyed by
+# buffer address (parent-side)
+received_slots = {}
+
+
 # overload torch.Tensor pickling to benefit from zero copy on buffer
 def pickle_tensor(t: torch.Tensor):
+    shm = pool_slots.get(t.data_ptr())
+    if shm is not None:  # send a small descriptor, the buffer itself never moves
+        dtype = str(t.dtype).replace("torch.", "")
+        return rebuild_slot, (shm.name, dtype, tuple(t.shape))
+
     return torch.from_numpy, (t.contiguous().numpy(),)
 
 
+def rebuild_slot(name, dtype, shape):
+    """Map a worker's shared-memory slot back into a tensor (parent-side)."""
+    shm = attached_segments.get(name)
+    if shm is None:  # map each segment once, later batches reuse the mapping
+        shm = attached_segments[name] = shared_memory.SharedMemory(name)
+    array = np.frombuffer(shm.buf, dtype=dtype, count=int(np.prod(shape)))
+    tensor = torch.from_numpy(array.reshape(shape))
+    received_slots[tensor.data_ptr()] = (name, dtype, shape)
+    return tensor
+
+
+def sample_schema(sample):
+    """Flatten the nested structure of a sample into leaf descriptors.
+
+    Returns the list of (path, getter, kind) triplets locating each leaf
+    and the information needed to re-assemble the nested containers, so
+    that traversals can run as a flat loop instead of a recursion.
+    """
+    leaves = []
+    containers = []  # parents come before their children
+    stack = [((), sample)]
+
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, torch.Tensor):
+            leaves.append((path, make_getter(path), "tensor"))
+        elif isinstance(value, np.ndarray):
+            leaves.append((path, make_getter(path), "ndarray"))
+        elif type(value) is int or isinstance(value, np.integer):
+            leaves.append((path, make_getter(path), "int"))
+        elif isinstance(value, (tuple, list)):
+            keys = tuple(range(len(value)))
+            containers.append((path, value.__class__, keys))
+            for k in keys:
+                stack.append((path + (k,), value[k]))
+        elif isinstance(value, dict):
+            keys = tuple(value.keys())
+            containers.append((path, value.__class__, keys))
+            for k in keys:
+                stack.append((path + (k,), value[k]))
+        else:
+            leaves.append((path, make_getter(path), None))
+
+    return leaves, containers
+
+
+def make_getter(path):
+    """Compile a leaf path into a fast accessor."""
+    if len(path) == 0:
+        return None
+    elif len(path) == 1:
+        return operator.itemgetter(path[0])
+    else:
+        getters = tuple(operator.itemgetter(k) for k in path)
+
+        def fetch_leaf(sample):
+            for g in getters:
+                sample = g(sample)
+            return sample
+
+        return fetch_leaf
+
+
+def map_tensors(value, func, schemas=None):
+    """Apply `func` to the tensors inside a nested object.
+
+    `schemas` is an optional cache mapping the value type to its probed
+    structure so repeated calls replay a flat loop over the leaves
+    instead of an isinstance cascade on every node.  Callers must use
+    one cache per stream of identically-structured values; without a
+    cache the structure is probed on every call.
+    """
+    if schemas is None:
+        schema = sample_schema(value)
+    else:
+        schema = schemas.get(type(value))
+        if schema is None:
+            schema = schemas[type(value)] = sample_schema(value)
+
+    leaves, containers = schema
+    results = {}
+
+    for path, getter, kind in leaves:
+        item = value if getter is None else getter(value)
+        results[path] = func(item) if kind == "tensor" else item
+
+    for path, cls, keys in reversed(containers):  # deepest containers first
+        if issubclass(cls, dict):
+            results[path] = cls((k, results[path + (k,)]) for k in keys)
+        else:
+            results[path] = cls(results[path + (k,)] for k in keys)
+
+    return results[()]
+
+
+class SharedTensorPool:
+    """Recycle shared-memory slots between workers and the parent.
+
+    Workers copy collated tensors into free shared-memory slots so that
+    only a small descriptor — the segment name, dtype and shape — crosses
+    the IPC channel.  Once the parent process drops a batch, its slots
+    are posted back to the workers for reuse instead of allocating a
+    fresh segment for every batch.  Segments are reclaimed by the
+    multiprocessing resource tracker at interpreter shutdown.
+    """
+
+    def __init__(self):
+        self.returned_slots = multiprocessing.get_context().Queue()
+        self.free_slots = {}  # (dtype, shape) -> free slots, worker-side
+        self.slots_by_name = {}  # segment name -> slot tensor, worker-side
+        self.schemas = {}  # batch structure cache, one pipeline per pool
+
+    def attach_slot(self, shm, dtype, shape):
+        """Register a tensor view over a pool segment (worker-side)."""
+        array = np.frombuffer(shm.buf, dtype=dtype, count=int(np.prod(shape)))
+        slot = torch.from_numpy(array.reshape(shape))
+        pool_slots[slot.data_ptr()] = shm
+        self.slots_by_name[shm.name] = slot
+        return slot
+
+    def recycle(self, tensor):
+        """Copy a tensor into a free shared-memory slot (worker-side)."""
+        while True:  # collect slots released by the parent
+            try:
+                name, dtype, shape = self.returned_slots.get_nowait()
+            except queue.Empty:
+                break
+            slot = self.slots_by_name.get(name)
+            if slot is None:  # slot allocated by another worker, adopt it
+                slot = self.attach_slot(shared_memory.SharedMemory(name), dtype, shape)
+            key = (slot.dtype, tuple(slot.shape))
+            self.free_slots.setdefault(key, []).append(slot)
+
+        cache = self.free_slots.get((tensor.dtype, tuple(tensor.shape)))
+        if cache:
+            slot = cache.pop()
+        else:
+            dtype = np.dtype(str(tensor.dtype).replace("torch.", ""))
+            size = max(1, tensor.numel() * dtype.itemsize)
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            slot = self.attach_slot(shm, dtype, tuple(tensor.shape))
+        slot.copy_(tensor)
+        return slot
+
+    def watch(self, tensor):
+        """Post a slot back to the workers once collected (parent-side)."""
+        descriptor = received_slots.pop(tensor.data_ptr())
+        weakref.finalize(tensor, self.returned_slots.put, descriptor)
+        return tensor
+
+    def send(self, value):
+        return map_tensors(value, self.recycle, self.schemas)
+
+    def recv(self, value):
+        return map_tensors(value, self.watch, self.schemas)
+
+
 def worker_init_fn_wrapper(user_fn, *kargs, **kwargs):
     copyreg.pickle(torch.Tensor, pickle_tensor)
     if user_fn is not None:
         user_fn(*kargs, **kwargs)
 
 
+def pin_tensor(tensor):
+    # pinning already-pinned tensors would allocate and copy wastefully
+    return tensor if tensor.is_pinned() else tensor.pin_memory()
+
+
 def pin_tensors_memory(value):
     """Pin memory of tensors inside an object."""
-    if isinstance(value, (tuple, list)):
-        return value.__class__(pin_tensors_memory(v) for v in value)
-    elif isinstance(value, dict):
-        return value.__class__((k, pin_tensors_memory(v)) for k, v in value.items())
-    elif isinstance(value, torch.Tensor):
-        return value.pin_memory()
+    return map_tensors(value, pin_tensor)
+
+
+class PinnedBufferRing:
+    """Copy tensors into a fixed ring of pre-pinned buffers.
+
+    Tensor.pin_memory() allocates fresh pinned pages for every batch,
+    which can balloon host memory when combined with deep prefetching.
+    Reusing a small ring of buffers allocated on first use caps pinned
+    memory at `size` times the batch size instead.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.rings = {}  # (dtype, shape) -> (buffers, next slot index)
+        self.schemas = {}  # batch structure cache, one pipeline per ring
+
+    def pin(self, tensor):
+        if tensor.is_pinned():  # already DMA-ready, skip the extra copy
+            return tensor
+
+        key = (tensor.dtype, tuple(tensor.shape))
+        ring = self.rings.get(key)
+        if ring is None:
+            buffers = [
+                torch.empty_like(tensor, pin_memory=True) for _ in range(self.size)
+            ]
+            ring = self.rings[key] = [buffers, 0]
+
+        buffers, i = ring
+        ring[1] = (i + 1) % self.size
+        slot = buffers[i]
+        slot.copy_(tensor, non_blocking=True)
+        return slot
+
+    def __call__(self, value):
+        return map_tensors(value, self.pin, self.schemas)
+
+
+def collate_with_schema(values, schema):
+    """Stack samples into a minibatch following a precomputed schema.
+
+    Each leaf is collated into a single pre-allocated output filled row
+    by row, which avoids the intermediate list-of-arrays that
+    :func:`torch.stack` would create.
+    """
+    leaves, containers = schema
+    results = {}
+
+    for path, getter, kind in leaves:
+        items = values if getter is None else [getter(v) for v in values]
+        first = items[0]
+
+        if kind == "tensor":
+            out = torch.empty((len(items),) + tuple(first.shape), dtype=first.dtype)
+            for i, item in enumerate(items):
+                out[i].copy_(item)
+        elif kind == "ndarray":
+            buf = np.empty((len(items),) + first.shape, dtype=first.dtype)
+            for i, item in enumerate(items):
+                buf[i] = item
+            out = torch.from_numpy(buf)
+        elif kind == "int":
+            out = torch.tensor(items)
+        else:
+            out = items
+
+        results[path] = out
+
+    for path, cls, keys in reversed(containers):  # deepest containers first
+        if issubclass(cls, dict):
+            results[path] = cls((k, results[path + (k,)]) for k in keys)
+        else:
+            results[path] = cls(results[path + (k,)] for k in keys)
+
+    return results[()]
 
 
 def default_collate_fn(values):
@@ -35,22 +293,38 @@ def default_collate_fn(values):
     if not isinstance(values, list):  # force evaluation if not done already
         values = list(values)
 
-    sample = values[0]
-
-    if isinstance(sample, torch.Tensor):
-        return torch.stack(values)
-    elif isinstance(sample, numbers.Integral):
-        return torch.tensor(values)
-    elif isinstance(sample, (tuple, list)):
-        return sample.__class__(default_collate_fn(row) for row in zip(*values))
-    elif isinstance(sample, dict):
-        return sample.__class__(
-            (k, default_collate_fn([v[k] for v in values])) for k in sample.keys()
-        )
+    return collate_with_schema(values, sample_schema(values[0]))
+
+
+def mmap_dataset(path, shape, dtype, random_access=True):
+    """Expose an on-disk binary blob as a zero-copy indexable array.
+
+    The file is mapped once per process, typically from a worker init
+    hook, so that reading an item is a page fault served by the OS cache
+    instead of one read syscall per sample.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ, flags=mmap.MAP_PRIVATE)
+    finally:
+        os.close(fd)
+
+    if hasattr(mm, "madvise"):  # tune kernel read-ahead, python >= 3.8
+        mm.madvise(mmap.MADV_RANDOM if random_access else mmap.MADV_SEQUENTIAL)
+
+    return np.frombuffer(mm, dtype=dtype).reshape((-1,) + tuple(shape))
 
 
 def gather_items(a, items):
-    return [a[i] for i in items]
+    # int() avoids re-entering tensor dispatch when items is a tensor row
+    return [a[int(i)] for i in items]
+
+
+def as_indices(sampler):
+    """Materialize sampler output, passing index arrays through as-is."""
+    if isinstance(sampler, (np.ndarray, torch.Tensor)):
+        return sampler
+    return list(sampler)
 
 
 class DataLoader:
@@ -89,69 +363,179 @@ class DataLoader:
         self.sampler = sampler
         self.batch_sampler = batch_sampler
         self.num_workers = num_workers
-        self.collate_fn = collate_fn or default_collate_fn
+        self.default_collate = collate_fn is None
+        if collate_fn is None:  # probe the sample structure once, then replay it
+            self.schemas = {}
+            collate_fn = self.cached_collate_fn
+        self.collate_fn = collate_fn
         self.pin_memory = pin_memory
         self.drop_last = drop_last
         self.worker_init_fn = partial(worker_init_fn_wrapper, worker_init_fn)
         self.prefetch_factor = prefetch_factor
+        # 'auto' starts from the usual default and adapts between epochs
+        self.prefetch_factor_value = 2 if prefetch_factor == "auto" else prefetch_factor
         self.shm_size = shm_size
+        if num_workers > 0 and shm_size == 0:
+            self.shared_pool = SharedTensorPool()
+        if pin_memory:
+            # one slot in flight, one held by the consumer, plus margin
+            # for the background prefetch buffer
+            self.pinned_ring = PinnedBufferRing(4)
+
+        # cache the number of batches, len(dataset) may not be trivial
+        if batch_sampler is not None:
+            self.length = len(batch_sampler)
+        else:
+            dataset_size = len(sampler) if sampler is not None else len(dataset)
+            if batch_size is None:
+                self.length = dataset_size
+            else:
+                self.length = dataset_size // batch_size
+                if dataset_size % batch_size > 0 and not drop_last:
+                    self.length += 1
+
+    def cached_collate_fn(self, values):
+        """Same as :func:`default_collate_fn` but with a cached schema probe."""
+        if not isinstance(values, list):
+            values = list(values)
+
+        key = type(values[0])
+        schema = self.schemas.get(key)
+        if schema is None:
+            schema = self.schemas[key] = sample_schema(values[0])
+
+        return collate_with_schema(values, schema)
 
     def __len__(self):
-        if self.batch_sampler:
-            return len(self.batch_sampler)
+        return self.length
+
+    def fetch_array_batch(self, indices, key):
+        start = key * self.batch_size
+        if indices is None:
+            stop = min(start + self.batch_size, len(self.dataset))
+            batch = self.dataset[start:stop]
+        else:
+            # the sampler may yield more indices than len(dataset), for
+            # example when sampling with replacement, so the last batch
+            # must be clamped against the indices and not the dataset
+            batch = self.dataset[indices[start:start + self.batch_size]]
+        if isinstance(batch, np.ndarray):
+            # default collate yields tensors, keep that contract (and the
+            # pin-memory stage working) on the fast path as well
+            batch = torch.from_numpy(batch)
+        return batch
+
+    def make_array_sequence(self):
+        """Pipeline head for array-backed datasets.
 
-        dataset_size = len(self.sampler) if self.sampler else len(self.dataset)
-        if self.batch_size and self.drop_last and dataset_size % self.batch_size > 0:
-            return dataset_size // self.batch_size
+        A single C-level fancy-indexing gather replaces batch_size
+        Python-level item lookups and the collation step.
+        """
+        if self.sampler is not None:
+            indices = as_indices(self.sampler)
+        elif self.shuffle:
+            # a fresh permutation per pipeline, overlapping iterators must
+            # not share one index buffer
+            indices = np.random.permutation(len(self.dataset))
         else:
-            return dataset_size // self.batch_size + 1
+            indices = None
+
+        if indices is not None and isinstance(self.dataset, torch.Tensor):
+            indices = torch.as_tensor(np.asarray(indices), dtype=torch.int64)
+
+        return seqtools.smap(
+            partial(self.fetch_array_batch, indices), seqtools.arange(self.length)
+        )
 
     def make_sequence(self):
         """Build a sequence that looks like a DataLoader when iterated over."""
+        # fast path: gather whole batches out of array-backed datasets
+        if (
+            isinstance(self.dataset, (np.ndarray, torch.Tensor))
+            and self.batch_sampler is None
+            and self.batch_size is not None
+            and self.default_collate
+        ):
+            return self.finalize_sequence(self.make_array_sequence())
+
         # shuffling
-        if self.batch_sampler:
-            batch_indices = list(self.batch_sampler)
+        if self.batch_sampler is not None:
+            batch_indices = as_indices(self.batch_sampler)
             out = seqtools.smap(partial(gather_items, self.dataset), batch_indices)
-        elif self.sampler:
-            shuffle_indices = list(self.sampler)
+        elif self.sampler is not None:
+            shuffle_indices = as_indices(self.sampler)
             out = seqtools.gather(self.dataset, shuffle_indices)
         elif self.shuffle:
-            shuffle_indices = torch.randperm(len(self.dataset))
-            out = seqtools.gather(self.dataset, shuffle_indices)
+            # a fresh permutation per pipeline, overlapping iterators must
+            # not share one index buffer
+            permutation = np.random.permutation(len(self.dataset))
+            out = seqtools.gather(self.dataset, permutation)
         else:
             out = self.dataset
 
         # batch
-        if not self.batch_sampler and self.batch_size is not None:
+        if self.batch_sampler is None and self.batch_size is not None:
             out = seqtools.batch(
                 out,
                 k=self.batch_size,
                 drop_last=self.drop_last,
                 collate_fn=self.collate_fn,
             )
-        elif self.batch_sampler:
+        elif self.batch_sampler is not None:
             out = seqtools.smap(self.collate_fn, out)
 
+        return self.finalize_sequence(out)
+
+    def finalize_sequence(self, out):
+        """Append the prefetch and pin-memory stages to a batch sequence."""
         # prefetch
         if self.num_workers > 0:
+            if self.shm_size == 0:
+                # without a seqtools shm pool, collated batches are copied
+                # into recycled shared-memory slots so that only a small
+                # descriptor crosses the IPC channel instead of the batch bytes
+                out = seqtools.smap(self.shared_pool.send, out)
             out = seqtools.prefetch(
                 out,
-                max_buffered=max(4, self.num_workers * self.prefetch_factor),
+                max_buffered=max(4, self.num_workers * self.prefetch_factor_value),
                 nworkers=self.num_workers,
                 method="process",
                 start_hook=self.worker_init_fn,
                 shm_size=self.shm_size,
             )
+            if self.shm_size == 0:  # return consumed slots to the workers
+                out = seqtools.smap(self.shared_pool.recv, out)
 
         # pin memory
         if self.pin_memory:
-            out = seqtools.smap(pin_tensors_memory, out)
+            out = seqtools.smap(self.pinned_ring, out)
             out = seqtools.prefetch(  # execute in background thread
                 out, nworkers=1, method="thread", max_buffered=1
             )
 
         return out
 
+    def tuning_iter(self, seq):
+        """Iterate over one epoch while measuring consumer starvation."""
+        wait = busy = 0.0
+        t_request = time.perf_counter()
+        for item in seq:
+            t_yield = time.perf_counter()
+            wait += t_yield - t_request
+            yield item
+            t_request = time.perf_counter()
+            busy += t_request - t_yield
+
+        # grow the buffer when the consumer starved, shrink it when the
+        # workers always stayed ahead, and let the next epoch use it
+        if busy > 0 and wait / busy > 0.1 and self.prefetch_factor_value < 8:
+            self.prefetch_factor_value += 1
+        elif busy > 0 and wait / busy < 0.01 and self.prefetch_factor_value > 1:
+            self.prefetch_factor_value -= 1
+
     def __iter__(self):
         """Instantiate a new data pipeline and return an iterator over it."""
-        return iter(self.make_sequence())
+        seq = self.make_sequence()
+        if self.prefetch_factor == "auto" and self.num_workers > 0:
+            return self.tuning_iter(seq)
+        return iter(seq)
@@ -17,24 +17,7 @@ prefetch routine which hides away the difficulties of concurrent
 processing into a simple sequence wrapper.
 """
 
-from . import instrument
-from .buffering import add_cache
-from .errors import EvaluationError, seterr
-from .evaluation import prefetch
-from .indexing import (
-    arange,
-    case,
-    cycle,
-    gather,
-    interleave,
-    repeat,
-    switch,
-    take,
-    uniter,
-)
-from .mapping import smap, starmap
-from .serialization import SerializableFunc
-from .shape import batch, collate, concatenate, split, unbatch
+import importlib
 
 __all__ = [
     "prefetch",
@@ -58,3 +41,49 @@ __all__ = [
     "unbatch",
     "split",
 ]
+
+# Location of the public symbols, imported lazily (PEP 562) so that
+# loading the package does not pay for unused submodules and their
+# dependencies.
+_lazy_attributes = {
+    "instrument": (".instrument", None),
+    "add_cache": (".buffering", "add_cache"),
+    "EvaluationError": (".errors", "EvaluationError"),
+    "seterr": (".errors", "seterr"),
+    "prefetch": (".evaluation", "prefetch"),
+    "arange": (".indexing", "arange"),
+    "case": (".indexing", "case"),
+    "cycle": (".indexing", "cycle"),
+    "gather": (".indexing", "gather"),
+    "interleave": (".indexing", "interleave"),
+    "repeat": (".indexing", "repeat"),
+    "switch": (".indexing", "switch"),
+    "take": (".indexing", "take"),
+    "uniter": (".indexing", "uniter"),
+    "smap": (".mapping", "smap"),
+    "starmap": (".mapping", "starmap"),
+    "SerializableFunc": (".serialization", "SerializableFunc"),
+    "batch": (".shape", "batch"),
+    "collate": (".shape", "collate"),
+    "concatenate": (".shape", "concatenate"),
+    "split": (".shape", "split"),
+    "unbatch": (".shape", "unbatch"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value  # cache so __getattr__ only runs once per symbol
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attributes))
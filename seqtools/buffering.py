@@ -1,5 +1,4 @@
 import threading
-from collections import OrderedDict
 
 from .utils import basic_getitem, basic_setitem
 
@@ -7,7 +6,9 @@ from .utils import basic_getitem, basic_setitem
 class CachedSequence:
     def __init__(self, sequence, cache_size=1, cache=None):
         self.sequence = sequence
-        self.cache = OrderedDict() if cache is None else cache
+        # a plain dict preserves insertion order (python >= 3.7) and is
+        # smaller and faster than OrderedDict
+        self.cache = {} if cache is None else cache
         self.cache_size = cache_size
         self.lock = threading.Lock()
 
@@ -21,12 +22,14 @@ class CachedSequence:
     @basic_getitem
     def __getitem__(self, key):
         with self.lock:
-            if key in self.cache.keys():
-                return self.cache[key]
+            if key in self.cache:
+                value = self.cache.pop(key)
+                self.cache[key] = value  # re-insert as most recently used
+                return value
             else:
                 value = self.sequence[key]
                 if len(self.cache) >= self.cache_size:
-                    self.cache.popitem(False)
+                    del self.cache[next(iter(self.cache))]  # evict oldest
                 self.cache[key] = value
                 return value
 
@@ -34,11 +37,73 @@ class CachedSequence:
     def __setitem__(self, key, value):
         with self.lock:
             self.sequence[key] = value
-            if key in self.cache.keys():
+            if key in self.cache:
                 self.cache[key] = value
 
 
-def add_cache(arr, cache_size=1, cache=None):
+class LFUCachedSequence:
+    """Sequence cache with least-frequently-used eviction.
+
+    Hit frequencies are tracked with one insertion-ordered bucket per
+    frequency so that lookups, promotions and evictions all run in O(1).
+    """
+
+    def __init__(self, sequence, cache_size=1):
+        self.sequence = sequence
+        self.cache = {}  # key -> (value, frequency)
+        self.buckets = {}  # frequency -> keys with that frequency, in order
+        self.min_freq = 0
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def __iter__(self):
+        # bypass cache as it will be useless
+        return iter(self.sequence)
+
+    def promote(self, key, freq):
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[freq]
+            if self.min_freq == freq:
+                self.min_freq = freq + 1
+        self.buckets.setdefault(freq + 1, {})[key] = None
+
+    @basic_getitem
+    def __getitem__(self, key):
+        with self.lock:
+            if key in self.cache:
+                value, freq = self.cache[key]
+                self.cache[key] = (value, freq + 1)
+                self.promote(key, freq)
+                return value
+            else:
+                value = self.sequence[key]
+                if len(self.cache) >= self.cache_size:
+                    bucket = self.buckets[self.min_freq]
+                    victim = next(iter(bucket))
+                    del bucket[victim]
+                    if not bucket:
+                        del self.buckets[self.min_freq]
+                    del self.cache[victim]
+                self.cache[key] = (value, 1)
+                self.buckets.setdefault(1, {})[key] = None
+                self.min_freq = 1
+                return value
+
+    @basic_setitem
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.sequence[key] = value
+            if key in self.cache:
+                _, freq = self.cache[key]
+                self.cache[key] = (value, freq)
+
+
+def add_cache(arr, cache_size=1, cache=None, policy="lru"):
     """
     Add a caching mechanism over a sequence.
 
@@ -50,6 +115,12 @@ def add_cache(arr, cache_size=1, cache=None):
         cache_size (int): Maximum number of cached values (default 1).
         cache (Optional[Dict[int, Any]]): Dictionary-like container to use as
             cache. Defaults to a standard :class:`python:dict`.
+        policy (str): Eviction policy, either `'lru'` (least recently
+            used, the default) or `'lfu'` (least frequently used).
+            `'lfu'` helps when cyclic access patterns, for example over
+            :func:`seqtools.cycle`, exceed the cache size and would
+            flush an LRU cache on every lap; it does not support the
+            `cache` argument.
 
     Return:
         (Sequence): The sequence wrapped with a cache.
@@ -79,4 +150,11 @@ def add_cache(arr, cache_size=1, cache=None):
         >>> cached[3]  # skips computation
         6
     """
-    return CachedSequence(arr, cache_size, cache)
+    if policy == "lru":
+        return CachedSequence(arr, cache_size, cache)
+    elif policy == "lfu":
+        if cache is not None:
+            raise ValueError("the 'lfu' policy does not support a custom cache")
+        return LFUCachedSequence(arr, cache_size)
+    else:
+        raise ValueError("policy must be 'lru' or 'lfu'")
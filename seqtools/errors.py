@@ -1,5 +1,6 @@
-import inspect
+import sys
 import threading
+import traceback
 
 
 class EvaluationError(Exception):
@@ -46,27 +47,22 @@ error_config = ErrorConfig()
 # Helpers ---------------------------------------------------------------------
 
 
-def unindent(lines):
-    if lines is None:
-        return []
+class LazyStack:
+    """A snapshot of the call stack which defers formatting until printed.
 
-    prefix = lines[0]
-    while len(prefix) > 0 and not prefix.isspace():
-        prefix = prefix[:-1]
+    Capturing frame summaries is cheap, reading source lines from disk
+    only happens if the stack actually ends up in an error message.
+    """
 
-    for line in lines[1:]:
-        while not line.startswith(prefix):
-            prefix = prefix[:-1]
+    def __init__(self, skip=1, limit=10):
+        self.summary = traceback.StackSummary.extract(
+            traceback.walk_stack(sys._getframe(skip)), limit=limit, lookup_lines=False
+        )
+        self.summary.reverse()  # oldest frame first, as in a traceback
 
-    return [line[len(prefix) :] for line in lines]
+    def __str__(self):
+        return "".join(self.summary.format())
 
 
 def format_stack(skip=1):
-    out = ""
-    for frame in inspect.stack()[skip:][::-1]:
-        _, filename, lineno, function, code_context, _ = frame
-        out += '  File "{}", line {}, in {}\n'.format(filename, lineno, function)
-        for line in unindent(code_context):
-            out += "    " + line
-
-    return out
+    return LazyStack(skip + 1)
@@ -11,6 +11,7 @@ import threading
 import time
 import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from multiprocessing import sharedctypes
 
 import threadpoolctl
@@ -358,6 +359,9 @@ def reraise_err(item, error, stack_desc=None):
         raise EvaluationError(msg) from error
 
 
+_MISSING = object()  # placeholder for empty completion slots
+
+
 class Prefetch:
     """Manage asynchronous workers to expose an ordered prefetched sequence."""
 
@@ -366,8 +370,11 @@ class Prefetch:
         self.backend = backend
         self.creation_stack = init_stack
 
-        self.jobs = []  # active jobs, queued or completed
-        self.completed = {}
+        self.jobs = deque()  # active jobs, queued or completed
+        # active job indexes are contiguous so results live in a ring buffer
+        # indexed by idx % buffer_size, no hashing on the hot path
+        self.completed = [_MISSING] * buffer_size
+        self.n_completed = 0
 
         for i in range(buffer_size):
             self.backend.submit_job(i)
@@ -384,28 +391,36 @@ class Prefetch:
             yield self[i]
 
     def __getitem__(self, item):
+        window = len(self.completed)
+
         # non-monotonic request
         if item != self.jobs[0]:
-            for _ in range(len(self.jobs) - len(self.completed)):
+            for _ in range(len(self.jobs) - self.n_completed):
                 self.backend.wait_completion()
 
-            self.completed.clear()
+            self.completed = [_MISSING] * window
+            self.n_completed = 0
 
-            self.jobs = list(range(item, item + len(self.jobs)))
+            self.jobs = deque(range(item, item + len(self.jobs)))
             for i in self.jobs:
                 self.backend.submit_job(i)
 
         # retrieve item, buffer other results
-        while item not in self.completed:
+        completed = self.completed
+        slot = item % window
+        while completed[slot] is _MISSING:
             idx, success, value = self.backend.wait_completion()
-            self.completed[idx] = success, value
+            completed[idx % window] = success, value
+            self.n_completed += 1
 
         self.backend.submit_job(item + len(self.jobs))
         self.jobs.append(item + len(self.jobs))
 
         # return value
-        self.jobs.pop(0)
-        success, value = self.completed.pop(item)
+        self.jobs.popleft()
+        success, value = completed[slot]
+        completed[slot] = _MISSING
+        self.n_completed -= 1
         if success:
             return value
         else:
@@ -455,6 +470,17 @@ def prefetch(
 
     Returns:
         Sequence: The wrapped sequence.
+
+    Note:
+        Each item incurs one round-trip with a worker, which can dominate
+        the runtime when items are small and cheap to compute. In that
+        case, group items with :func:`seqtools.batch` before prefetching
+        and flatten the result with :func:`seqtools.unbatch` to amortize
+        the communication overhead::
+
+            batched = seqtools.batch(seq, 16, collate_fn=list)
+            prefetched = seqtools.prefetch(batched, nworkers=2)
+            out = seqtools.unbatch(prefetched, 16, len(seq) % 16)
     """
     if max_buffered <= 0:
         raise ValueError("max_buffered must be greater than 0")
@@ -61,9 +61,16 @@ def arange(start, stop=None, step=None):
 
 
 class Gathering:
+    __slots__ = ("sequence", "indexes")
+
     def __init__(self, sequence, indexes: Sequence[int]):
         if isinstance(sequence, Gathering):  # optimize nested subsets
-            self.indexes = [sequence.indexes[i] for i in indexes]
+            parent = sequence.indexes
+            if hasattr(parent, "dtype") and hasattr(indexes, "dtype"):
+                # ndarray-like indexes compose with a single C-level gather
+                self.indexes = parent[indexes]
+            else:
+                self.indexes = [parent[i] for i in indexes]
             self.sequence = sequence.sequence
         else:
             self.indexes = indexes
@@ -77,18 +84,19 @@ class Gathering:
             yield self.sequence[i]
 
     def __getitem__(self, key):
-        if isinstance(key, slice):
-            return gather(self.sequence, self.indexes[key])
-
-        elif isint(key):
-            if key < -len(self) or key >= len(self):
+        if isint(key):  # most common key type, check it first
+            size = len(self.indexes)
+            if key < -size or key >= size:
                 raise IndexError(self.__class__.__name__ + " index out of range")
 
             if key < 0:
-                key = len(self) + key
+                key += size
 
             return self.sequence[self.indexes[key]]
 
+        elif isinstance(key, slice):
+            return gather(self.sequence, self.indexes[key])
+
         else:
             raise TypeError(
                 self.__class__.__name__ + " indices must be integers or "
@@ -96,7 +104,17 @@ class Gathering:
             )
 
     def __setitem__(self, key, value):
-        if isinstance(key, slice):
+        if isint(key):  # most common key type, check it first
+            size = len(self.indexes)
+            if key < -size or key >= size:
+                raise IndexError(self.__class__.__name__ + " index out of range")
+
+            if key < 0:
+                key += size
+
+            self.sequence[self.indexes[key]] = value
+
+        elif isinstance(key, slice):
             indexes = self.indexes[key]
 
             if len(indexes) != len(value):
@@ -107,15 +125,6 @@ class Gathering:
             for i, val in zip(indexes, value):
                 self.sequence[i] = val
 
-        elif isint(key):
-            if key < -len(self) or key >= len(self):
-                raise IndexError(self.__class__.__name__ + " index out of range")
-
-            if key < 0:
-                key = len(self) + key
-
-            self.sequence[self.indexes[key]] = value
-
         else:
             raise TypeError(
                 self.__class__.__name__ + " indices must be integers or "
@@ -149,36 +158,38 @@ class Cycle:
     def __init__(self, sequence, size):
         self.sequence = sequence
         self.size = int(size)
+        self.wrap = len(sequence)
+        # a power-of-two period wraps with a bitwise and, not a division
+        self.mask = self.wrap - 1 if self.wrap & (self.wrap - 1) == 0 else None
 
     def __len__(self):
         return self.size
 
     def __iter__(self):
-        i = 0
-        while True:
-            for v in self.sequence:
-                yield v
-                i += 1
-                if i == self.size:
-                    return
+        # C-level looping, each lap starts a fresh iteration of the sequence
+        laps = itertools.chain.from_iterable(itertools.repeat(self.sequence))
+        return itertools.islice(laps, self.size)
 
     @basic_getitem
     def __getitem__(self, key):
-        return self.sequence[key % len(self.sequence)]
+        mask = self.mask
+        return self.sequence[key & mask if mask is not None else key % self.wrap]
 
     @basic_setitem
     def __setitem__(self, key, value):
-        self.sequence[key % len(self.sequence)] = value
+        mask = self.mask
+        self.sequence[key & mask if mask is not None else key % self.wrap] = value
 
 
 class InfiniteCycle:
     def __init__(self, sequence):
         self.sequence = sequence
+        self.wrap = len(sequence)
+        self.mask = self.wrap - 1 if self.wrap & (self.wrap - 1) == 0 else None
 
     def __iter__(self):
-        while True:
-            for v in self.sequence:
-                yield v
+        # C-level looping, each lap starts a fresh iteration of the sequence
+        return itertools.chain.from_iterable(itertools.repeat(self.sequence))
 
     def __getitem__(self, key):
         if isinstance(key, slice):
@@ -193,7 +204,7 @@ class InfiniteCycle:
                     + self.__class__.__name__
                 )
 
-            offset = start - start % len(self.sequence)
+            offset = start - start % self.wrap
             start -= offset
             stop -= offset
             return Cycle(self.sequence, stop)[start:stop:step]
@@ -205,7 +216,8 @@ class InfiniteCycle:
                     + self.__class__.__name__
                 )
 
-            return self.sequence[key % len(self.sequence)]
+            mask = self.mask
+            return self.sequence[key & mask if mask is not None else key % self.wrap]
 
         else:
             raise TypeError(
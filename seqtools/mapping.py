@@ -3,6 +3,8 @@ from .utils import basic_getitem
 
 
 class Mapping(object):
+    __slots__ = ("sequences", "f", "stack")
+
     def __init__(self, f, *sequences):
         if not callable(f):
             raise TypeError("f must be callable")
@@ -35,7 +37,11 @@ class Mapping(object):
     @basic_getitem
     def __getitem__(self, item):
         try:
-            return self.f(*(l[item] for l in self.sequences))
+            # most mappings have a single input, skip argument packing for them
+            if len(self.sequences) == 1:
+                return self.f(self.sequences[0][item])
+            else:
+                return self.f(*[l[item] for l in self.sequences])
 
         except Exception as cause:
             if seterr() == "passthrough" or isinstance(cause, EvaluationError):
@@ -47,6 +53,19 @@ class Mapping(object):
                 raise EvaluationError(msg) from cause
 
 
+class _Fused:
+    """Composition of two mapping functions, picklable if they are."""
+
+    __slots__ = ("f", "g")
+
+    def __init__(self, f, g):
+        self.f = f
+        self.g = g
+
+    def __call__(self, x):
+        return self.f(self.g(x))
+
+
 def smap(f, *sequences):
     """Return a mapping of `f` over the sequence(s).
 
@@ -81,6 +100,12 @@ def smap(f, *sequences):
         computing now
         [5, 5, 5, 5]
     """
+    # fuse chained mappings into one to save a python call per layer per item
+    if len(sequences) == 1 and type(sequences[0]) is Mapping:
+        inner = sequences[0]
+        if len(inner.sequences) == 1:
+            return Mapping(_Fused(f, inner.f), inner.sequences[0])
+
     return Mapping(f, *sequences)
 
 
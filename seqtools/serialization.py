@@ -3,12 +3,10 @@ Hackish workaround to help serialize a pipeline inclusing its functions.
 """
 
 import functools
+import hashlib
+import importlib.util
 import inspect
-import os
-import shutil
 import sys
-import tempfile
-from importlib import import_module, reload
 
 
 class SerializableFunc:
@@ -32,11 +30,18 @@ class SerializableFunc:
             self.func = func.func
         else:
             self.name = func.__name__
-            filename = inspect.getsourcefile(func)
-            if filename is None:
-                raise RuntimeError("failed to locate source file for " + func.__name__)
-            with open(filename) as dump_file:
-                self.source = dump_file.read()
+            module = sys.modules.get(getattr(func, "__module__", None))
+            source = getattr(module, "__serialized_source__", None)
+            if source is not None:  # function from an unpickled in-memory module
+                self.source = source
+            else:
+                filename = inspect.getsourcefile(func)
+                if filename is None:
+                    raise RuntimeError(
+                        "failed to locate source file for " + func.__name__
+                    )
+                with open(filename) as dump_file:
+                    self.source = dump_file.read()
             self.func = func
             functools.update_wrapper(self, func)
 
@@ -49,16 +54,19 @@ class SerializableFunc:
     def __setstate__(self, state):
         self.source, self.name = state
 
-        tmpdir = tempfile.mkdtemp()
-        try:
-            with open(os.path.join(tmpdir, "module.py"), "w") as dump_file:
-                dump_file.write(self.source)
+        # execute the source as an in-memory module, identical source strings
+        # share the already loaded module instead of being recompiled
+        modname = "seqtools_serfunc_" + hashlib.sha1(self.source.encode()).hexdigest()
+        module = sys.modules.get(modname)
+        if module is None:
+            spec = importlib.util.spec_from_loader(modname, loader=None)
+            module = importlib.util.module_from_spec(spec)
+            module.__serialized_source__ = self.source
+            sys.modules[modname] = module
+            try:
+                exec(compile(self.source, "<" + modname + ">", "exec"), module.__dict__)
+            except BaseException:
+                del sys.modules[modname]
+                raise
 
-            sys.path.insert(0, tmpdir)
-            module = import_module("module")
-            module = reload(module)
-            self.func = getattr(module, self.name)
-            sys.path.pop(0)
-
-        finally:
-            shutil.rmtree(tmpdir)
+        self.func = getattr(module, self.name)
@@ -8,13 +8,16 @@ from .utils import basic_getitem, basic_setitem, clip, get_logger, isint
 
 
 class Collation:
+    __slots__ = ("sequences",)
+
     def __init__(self, sequences):
         try:
-            lengths = [len(s) for s in sequences]
+            size = len(sequences[0])
+            mismatch = any(len(s) != size for s in sequences)
         except TypeError:  # sequence has no len
             pass
         else:
-            if any(l != lengths[0] for l in lengths):
+            if mismatch:
                 raise ValueError("sequences len() don't match")
         self.sequences = sequences
 
@@ -55,6 +58,8 @@ def collate(sequences):
 
 
 class Concatenation(object):
+    __slots__ = ("sequences", "offsets")
+
     def __init__(self, sequences):
         self.sequences = []
         for seq in sequences:
@@ -64,29 +69,31 @@ class Concatenation(object):
             else:
                 self.sequences.append(seq)
 
-        self.offsets = array.array("L", [0] + [len(seq) for seq in self.sequences])
-        for i in range(1, len(self.sequences) + 1):
-            self.offsets[i] += self.offsets[i - 1]
+        # a plain list of ints: bisect probes then compare against already
+        # boxed values instead of boxing an array item on every probe, and
+        # there is only one offset per sequence anyway
+        offsets = [0]
+        for seq in self.sequences:
+            offsets.append(offsets[-1] + len(seq))
+        self.offsets = offsets
 
     def __len__(self):
-        return int(self.offsets[-1])
+        return self.offsets[-1]
 
     def __iter__(self):
         return itertools.chain(*self.sequences)
 
     @basic_getitem
     def __getitem__(self, key):
-        target_seq = bisect.bisect(self.offsets, key) - 1
-        seq = self.sequences[target_seq]
-        offset = self.offsets[target_seq]
-        return seq[key - offset]
+        offsets = self.offsets
+        target_seq = bisect.bisect(offsets, key) - 1
+        return self.sequences[target_seq][key - offsets[target_seq]]
 
     @basic_setitem
     def __setitem__(self, key, value):
-        target_seq = bisect.bisect(self.offsets, key) - 1
-        seq = self.sequences[target_seq]
-        offset = self.offsets[target_seq]
-        seq[key - offset] = value
+        offsets = self.offsets
+        target_seq = bisect.bisect(offsets, key) - 1
+        self.sequences[target_seq][key - offsets[target_seq]] = value
 
 
 def concatenate(sequences):
@@ -105,10 +112,15 @@ def concatenate(sequences):
         >>> [cat[i] for i in range(12)]
         [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
     """
+    sequences = list(sequences)
+    if len(sequences) == 1:  # nothing to concatenate, skip the indirection
+        return sequences[0]
     return Concatenation(sequences)
 
 
 class BatchView(object):
+    __slots__ = ("sequence", "batch_size", "drop_last", "pad", "collate_fn")
+
     def __init__(
         self, sequence, batch_size, drop_last=False, pad=None, collate_fn=None
     ):
@@ -138,12 +150,18 @@ class BatchView(object):
 
     @basic_getitem
     def __getitem__(self, key):
-        start = key * self.batch_size
-        stop = min((key + 1) * self.batch_size, len(self.sequence))
-        result = [self.sequence[i] for i in range(start, stop)]
+        sequence = self.sequence
+        batch_size = self.batch_size
+        start = key * batch_size
+        stop = min(start + batch_size, len(sequence))
+        if hasattr(sequence, "dtype"):
+            # ndarray-like inputs slice into a contiguous view in one call
+            result = sequence[start:stop]
+        else:
+            result = [sequence[i] for i in range(start, stop)]
 
         if self.pad is not None and key == (len(self) - 1):
-            pad_size = self.batch_size - len(self.sequence) % self.batch_size
+            pad_size = batch_size - len(sequence) % batch_size
             result = concatenate((result, [self.pad] * pad_size))
 
         if self.collate_fn is not None:
@@ -229,7 +247,8 @@ class Unbatching(object):
 
     @basic_getitem
     def __getitem__(self, key):
-        return self.sequence[key // self.batch_size][key % self.batch_size]
+        batch_size = self.batch_size
+        return self.sequence[key // batch_size][key % batch_size]
 
 
 def unbatch(sequence, batch_size, last_batch_size=None):
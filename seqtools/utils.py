@@ -5,9 +5,18 @@ import numbers
 from logging import NullHandler
 
 
+# one entry per key type ever seen, so the Integral ABC walk runs once
+# per type (e.g. np.int64) instead of once per lookup
+_int_types = {int: True, bool: True}
+
+
 def isint(x):
     """Return wether `x` is an integral number."""
-    return isinstance(x, numbers.Integral)
+    r = _int_types.get(type(x))
+    if r is None:
+        r = isinstance(x, numbers.Integral)
+        _int_types[type(x)] = r
+    return r
 
 
 def clip(x, a, b):
@@ -35,10 +44,7 @@ def basic_getitem(func):
     """
 
     def getitem(self, key):
-        if isinstance(key, slice):
-            return SeqSlice(self, key)
-
-        elif isint(key):
+        if isint(key):  # most common key type, check it first
             if key < 0:
                 if key < -len(self):
                     raise IndexError(self.__class__.__name__ + " index out of range")
@@ -54,6 +60,9 @@ def basic_getitem(func):
 
             return func(self, key)
 
+        elif isinstance(key, slice):
+            return SeqSlice(self, key)
+
         else:
             raise TypeError(
                 self.__class__.__name__ + " indices must be integers or "
@@ -77,7 +86,16 @@ def basic_setitem(func):
     """
 
     def setitem(self, key, value):
-        if isinstance(key, slice):
+        if isint(key):  # most common key type, check it first
+            if key < -len(self) or key >= len(self):
+                raise IndexError(self.__class__.__name__ + " index out of range")
+
+            if key < 0:
+                key = len(self) + key
+
+            func(self, key, value)
+
+        elif isinstance(key, slice):
             slice_view = SeqSlice(self, key)
 
             if len(slice_view) != len(value):
@@ -88,15 +106,6 @@ def basic_setitem(func):
             for i, val in enumerate(value):
                 slice_view[i] = val
 
-        elif isint(key):
-            if key < -len(self) or key >= len(self):
-                raise IndexError(self.__class__.__name__ + " index out of range")
-
-            if key < 0:
-                key = len(self) + key
-
-            func(self, key, value)
-
         else:
             raise TypeError(
                 self.__class__.__name__ + " indices must be integers or "
@@ -120,24 +129,11 @@ def normalize_slice(start, stop, step, size):
         and stop are positive integers and the base index can be easily
         computed by :code:`start + i * step`.
     """
-    if step is None:
-        step = 1
-    elif step == 0:
+    if step == 0:
         raise ValueError("slice step cannot be 0")
 
-    if start is None:
-        start = 0 if step > 0 else size - 1
-    elif start >= 0:
-        start = min(start, size - 1)
-    else:
-        start = max(0, size + start)
-
-    if stop is None:
-        stop = size if step > 0 else -1
-    elif stop >= 0:
-        stop = min(stop, size)
-    else:
-        stop = max(-1, size + stop)
+    # C-implemented clamping of boundaries, handles all edge cases
+    start, stop, step = slice(start, stop, step).indices(size)
 
     if (stop - start) / step < 0:
         stop = start
@@ -171,17 +167,34 @@ class SeqSlice:
         self.start = start
         self.stop = stop
         self.step = step
+        self.size = abs(stop - start) // abs(step)
 
     def __len__(self):
-        return abs(self.stop - self.start) // abs(self.step)
+        return self.size
 
     def __iter__(self):
+        sequence = self.sequence
         for i in range(self.start, self.stop, self.step):
-            yield self.sequence[i]
+            yield sequence[i]
 
-    @basic_getitem
     def __getitem__(self, key):
-        return self.sequence[self.start + key * self.step]
+        if isint(key):  # most common key type, check it first
+            size = self.size
+            if key < 0:
+                key += size
+            if key < 0 or key >= size:
+                raise IndexError(self.__class__.__name__ + " index out of range")
+
+            return self.sequence[self.start + key * self.step]
+
+        elif isinstance(key, slice):
+            return SeqSlice(self, key)
+
+        else:
+            raise TypeError(
+                self.__class__.__name__ + " indices must be integers or "
+                "slices, not " + key.__class__.__name__
+            )
 
     @basic_setitem
     def __setitem__(self, key, value):
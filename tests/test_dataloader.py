@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+torch = pytest.importorskip("torch")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "docs", "examples"))
+
+from dataloader import DataLoader  # noqa: E402
+
+
+def test_sampler_array():
+    # array-backed dataset with a permutation array as sampler
+    data = np.arange(100, dtype=np.float32).reshape(50, 2)
+    order = np.random.permutation(50)
+    loader = DataLoader(data, batch_size=10, sampler=order)
+
+    batches = list(loader)
+    assert len(loader) == len(batches) == 5
+    assert all(isinstance(b, torch.Tensor) for b in batches)
+    assert torch.equal(torch.cat(batches), torch.from_numpy(data[order]))
+
+    # the sampler may draw more indices than the dataset holds
+    oversample = np.random.randint(0, 50, size=75)
+    loader = DataLoader(data, batch_size=10, sampler=oversample)
+    batches = list(loader)
+    assert len(batches) == 8 and len(batches[-1]) == 5
+    assert torch.equal(torch.cat(batches), torch.from_numpy(data[oversample]))
+
+    # generic dataset goes through the gather path
+    dataset = [i * 2 for i in range(20)]
+    loader = DataLoader(dataset, batch_size=5, sampler=np.random.permutation(20))
+    flat = [v for b in loader for v in b.tolist()]
+    assert sorted(flat) == sorted(dataset)
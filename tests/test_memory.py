@@ -43,6 +43,30 @@ def test_cached():
     assert duration < 0.28
 
 
+def test_cached_lfu():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x
+
+    arr = list(range(10))
+    z = add_cache(smap(f, arr), 2, policy="lfu")
+
+    assert z[0] == 0
+    assert z[0] == 0
+    assert calls == [0]  # second read is a hit
+    assert z[1] == 1
+    assert z[2] == 2  # evicts 1 which has the lowest frequency
+    assert z[0] == 0
+    assert calls == [0, 1, 2]
+    assert z[1] == 1
+    assert calls == [0, 1, 2, 1]
+
+    with pytest.raises(ValueError):
+        add_cache(arr, 2, policy="random")
+
+
 @pytest.mark.timeout(5)
 def test_cached_timing():  # pragma: no cover
     def f(x):